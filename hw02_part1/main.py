@@ -1,29 +1,32 @@
-from collections import UserDict
-from datetime import datetime, timedelta
+from datetime import datetime, date, timedelta
+from functools import lru_cache
+import mmap
+import os
 import pickle
-from abc import ABC, abstractmethod
+import re
+import sys
+import weakref
+from typing import Protocol
 
-class BaseView(ABC):
-    @abstractmethod
-    def display_contacts(self, book):
-        pass
+class BaseView(Protocol):  # View interface; a Protocol adds no metaclass cost to implementors.
+    def display_contacts(self, book): ...
 
-    @abstractmethod
-    def display_message(self, message: str):
-        pass
+    def display_message(self, message: str): ...
 
-    @abstractmethod
-    def display_help(self):
-        pass
+    def display_help(self): ...
 
 
-class ConsoleView(BaseView):
+class ConsoleView:
     def display_contacts(self, book):
-        print("Contacts:")
-        if not book.data:
-            print("No contacts found.")
+        # Stream record by record instead of building one big joined string.
+        write = sys.stdout.write
+        write("Contacts:\n")
+        if not book:
+            write("No contacts found.\n")
         else:
-            print("\n".join(str(record) for record in book.data.values()))
+            for record in book.values():
+                write(str(record))
+                write("\n")
 
     def display_message(self, message: str):
         print(message)
@@ -38,139 +41,311 @@ class ConsoleView(BaseView):
     add-birthday [name] [birthday] - Add a birthday to a contact.
     show-birthday [name] - Show the birthday of a contact.
     birthdays - Show upcoming birthdays within 7 days.
+    load [file] - Add contacts in bulk from a file of "name phone" lines.
     hello - Get a greeting from the bot.
     close or exit - Exit the program."""
         )
 
 
-class Field:
-    def __init__(self, value):
-        self.value = value
+_PHONE_RE = re.compile(r"\d{10}").fullmatch  # Compiled once at import.
 
-    def __str__(self):
-        return str(self.value)
 
+def _validate_phone(phone):  # Format validation (10 digits).
+    if _PHONE_RE(phone) is None:
+        raise ValueError
+    return phone
 
-class Name(Field):  # Class for storing contact name.
-    def __init__(self, value):
-        super().__init__(value)
 
+def _parse_birthday(value):
+    try:
+        return datetime.strptime(value, "%d.%m.%Y").date()
+    except ValueError:
+        raise ValueError("Invalid date format. Use DD.MM.YYYY")
 
-class Phone(Field):  # Class for storing phone numbers.
-    def __init__(self, value):
-        if len(value) == 10 and value.isdigit():  # Format validation (10 digits).
-            super().__init__(value)
-        else:
-            raise ValueError
 
+_book_version = 0  # Bumped on every mutation so caches can detect stale data.
 
-class Birthday(Field):
-    def __init__(self, value):
-        try:
-            datetime.strptime(value, "%d.%m.%Y")  # Тільки перевірка формату
-            super().__init__(value)
-        except ValueError:
-            raise ValueError("Invalid date format. Use DD.MM.YYYY")
+
+def _bump_version():
+    global _book_version
+    _book_version += 1
 
 
 class Record:
+    __slots__ = ("name", "_phones", "birthday", "_repr", "_book")
+
     def __init__(self, name):
-        self.name = Name(name)
-        self.phones = []
+        self.name = name
+        self._phones = {}  # Validated phone strings keyed by themselves for O(1) lookup.
         self.birthday = None
+        self._repr = None  # Cached __str__ result, dropped on mutation.
+        self._book = None  # Weakref to the owning AddressBook, set by add_record.
+
+    @property
+    def phones(self):
+        return list(self._phones)
 
     def add_phone(self, phone):  # Method for adding.
-        self.phones.append(Phone(phone))
+        phone = _validate_phone(phone)
+        self._phones.setdefault(phone, phone)
+        self._repr = None
+        _bump_version()
 
-    def find_phone(self, phone):  # Method for finding Phone objects.
-        for phone_obj in self.phones:
-            if phone_obj.value == phone:
-                return phone_obj
-        return None
+    def find_phone(self, phone):  # Method for finding phone numbers.
+        return self._phones.get(phone)
 
     def remove_phone(self, phone):  # Method for removal.
-        self.phones.remove(self.find_phone(phone))
+        self._phones.pop(phone, None)
+        self._repr = None
+        _bump_version()
 
     def edit_phone(self, old_phone, new_phone):  # Method for editing.
         if self.find_phone(old_phone):  # If the old_phone exists and the new_phone is valid.
-            self.add_phone(new_phone)
-            self.remove_phone(old_phone)
+            if new_phone != old_phone:  # Else removing old would drop the freshly set key.
+                self.add_phone(new_phone)
+                self.remove_phone(old_phone)
         else:
             raise ValueError
 
     def add_birthday(self, birthday):
-        self.birthday = Birthday(birthday)
-
-    def __str__(self):
-        birthday = f", birthday: {self.birthday.value}" if self.birthday else ""
-        return f"Contact name: {self.name.value}, phones: {'; '.join(p.value for p in self.phones)}{birthday}"
+        self.birthday = _parse_birthday(birthday)
+        self._repr = None
+        book = self._book() if self._book is not None else None
+        if book is not None:
+            book._bday_index.add(self.name)
+        _bump_version()
 
+    def __reduce__(self):  # Pickle as a flat tuple instead of a class/state pair.
+        birthday = self.birthday.isoformat() if self.birthday else None
+        return (_rebuild_record, (self.name, list(self._phones), birthday))
 
-class AddressBook(UserDict):
-    def add_record(self, record):  # Method that adds a record to "self.data".
-        self.data[record.name.value] = record
+    def __str__(self):
+        if self._repr is None:
+            birthday = f", birthday: {self.birthday.strftime('%d.%m.%Y')}" if self.birthday else ""
+            self._repr = f"Contact name: {self.name}, phones: {'; '.join(self._phones)}{birthday}"
+        return self._repr
+
+
+class AddressBook(dict):  # Plain dict subclass: C-level item access, no .data indirection.
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._bday_cache = (None, None, None)  # (day, book version, result)
+        self._bday_index = set()  # Names of records that have a birthday.
+        self._saved_version = None  # Book version at last save/load; None = never saved.
+        self._today = None  # Today's date, refreshed once per command cycle by main.
+
+    def add_record(self, record):  # Method that adds a record to the book.
+        self[record.name] = record
+        record._book = weakref.ref(self)
+        if record.birthday:
+            self._bday_index.add(record.name)
+        else:  # Overwriting a record may drop a birthday the index still lists.
+            self._bday_index.discard(record.name)
+        _bump_version()
+
+    def bulk_add(self, items):
+        # Batch insert of (name, phone) pairs: one pass, one version bump,
+        # no per-call record lookup overhead from the command layer.
+        count = 0
+        try:
+            for name, phone in items:
+                phone = _validate_phone(phone)  # Validate before touching the book.
+                record = self.get(name)
+                if record is None:
+                    record = Record(name)
+                    record._book = weakref.ref(self)
+                    self[name] = record
+                record._phones.setdefault(phone, phone)
+                record._repr = None
+                count += 1
+        finally:
+            if count:  # Keep already-inserted pairs saveable even if a later one raises.
+                _bump_version()
+        return count
 
     def find(self, name):  # Method that finds a record by name.
-        return self.data.get(name)
+        return self.get(name)
 
     def delete(self, name):  # Method that deletes a record by name.
-        if name in self.data:
-            del self.data[name]
+        if name in self:
+            del self[name]
+            self._bday_index.discard(name)
+            _bump_version()
+
+    def get_upcoming_birthdays(self, today=None):
+        if today is None:
+            today = self._today or date.today()
+        cached_day, cached_version, cached = getattr(self, "_bday_cache", (None, None, None))
+        if cached_day == today and cached_version == _book_version:
+            return cached
 
-    def get_upcoming_birthdays(self):
         upcoming_birthdays = []
-        today = datetime.today().date()
-
-        for record in self.data.values():
-            if record.birthday:
-                birthday_date = datetime.strptime(record.birthday.value, "%d.%m.%Y").date()
-                birthday_this_year = birthday_date.replace(year=today.year)
-
-                if birthday_this_year < today:
-                    birthday_this_year = birthday_date.replace(year=today.year + 1)
-
-                if 0 <= (birthday_this_year - today).days <= 7:
-                    congratulation_date = birthday_this_year
-                    if congratulation_date.weekday() >= 5:
-                        congratulation_date += timedelta(days=(7 - congratulation_date.weekday()))
-                    upcoming_birthdays.append(
-                        {"name": record.name.value, "birthday": congratulation_date.strftime("%d.%m.%Y")})
+        today_ordinal = today.toordinal()
+        year = today.year
+
+        for name in sorted(self._bday_index):  # Sorted for deterministic output order.
+            record = self.get(name)
+            if record is None or record.birthday is None:
+                continue  # Index entry desynced by direct API use; skip it.
+            month, day = record.birthday.month, record.birthday.day
+            try:
+                birthday_this_year = date(year, month, day)
+            except ValueError:  # Feb 29 in a non-leap year.
+                birthday_this_year = date(year, 3, 1)
+
+            if birthday_this_year.toordinal() < today_ordinal:
+                try:
+                    birthday_this_year = date(year + 1, month, day)
+                except ValueError:
+                    birthday_this_year = date(year + 1, 3, 1)
+
+            if 0 <= birthday_this_year.toordinal() - today_ordinal <= 7:
+                congratulation_date = birthday_this_year
+                if congratulation_date.weekday() >= 5:
+                    congratulation_date += timedelta(days=(7 - congratulation_date.weekday()))
+                upcoming_birthdays.append(
+                    f"{record.name}: {congratulation_date.strftime('%d.%m.%Y')}")
+        self._bday_cache = (today, _book_version, upcoming_birthdays)
         return upcoming_birthdays
 
+    def __reduce__(self):  # Pickle the whole book as one list of record tuples.
+        return (_rebuild_book, ([record.__reduce__()[1] for record in self.values()],))
+
     def __str__(self):
-        return "\n".join(str(record) for record in self.data.values())
+        return "\n".join(str(record) for record in self.values())
+
+
+def _rebuild_record(name, phones, birthday):
+    # Data was validated before it was pickled; skip re-validation on load.
+    record = Record(name)
+    record._phones = {phone: phone for phone in phones}
+    if birthday is not None:
+        record.birthday = date.fromisoformat(birthday)
+    return record
+
+
+def _rebuild_book(rows):
+    book = AddressBook()
+    for row in rows:
+        book.add_record(_rebuild_record(*row))
+    return book
+
+
+class _LegacyObject:
+    # Inert stand-in instantiated only by _MigratingUnpickler; accepts the
+    # state of any pickle written before the flat __reduce__ format.
+    def __init__(self, *args):
+        pass
+
+    def __setstate__(self, state):
+        if isinstance(state, tuple):  # (dict state, slots state) from a __slots__ era.
+            state = {key: value for part in state if part for key, value in part.items()}
+        self.__dict__.update(state or {})
+
+
+class _LegacyField(_LegacyObject):
+    value = None
+
+
+_LEGACY_CLASSES = {
+    "Field": _LegacyField,
+    "Name": _LegacyField,
+    "Phone": _LegacyField,
+    "Birthday": _LegacyField,
+    "Record": _LegacyObject,
+    "AddressBook": _LegacyObject,
+}
+
+
+class _MigratingUnpickler(pickle.Unpickler):
+    def find_class(self, module, name):
+        # Old pickles reference the removed wrapper classes by name; map them
+        # to shims so their data survives and _migrate_book can rebuild it.
+        legacy = _LEGACY_CLASSES.get(name)
+        if legacy is not None:
+            return legacy
+        if module in ("__main__", __name__):
+            # Resolve our own globals whether the file was written by
+            # 'python main.py' or by an import of this module.
+            obj = globals().get(name)
+            if obj is not None:
+                return obj
+        return super().find_class(module, name)
+
+
+def _unwrap(value):
+    return value.value if isinstance(value, _LegacyField) else value
+
+
+def _migrate_book(old_book):
+    # Rebuild a current AddressBook from an old-format object graph.
+    book = AddressBook()
+    for old in getattr(old_book, "data", {}).values():
+        state = old.__dict__
+        record = Record(_unwrap(state["name"]))
+        for phone in state.get("_phones") or state.get("phones") or ():
+            phone = _unwrap(phone)
+            record._phones[phone] = phone
+        birthday = _unwrap(state.get("birthday"))
+        if isinstance(birthday, str):
+            birthday = datetime.strptime(birthday, "%d.%m.%Y").date()
+        record.birthday = birthday
+        book.add_record(record)
+    return book
 
 
 def save_data(book, filename="addressbook.pkl"):
-    with open(filename, "wb") as f:
-        pickle.dump(book, f)
+    # The version counter is process-global and says nothing about *where* the
+    # book was loaded from, so only skip when the target file already exists.
+    if book._saved_version == _book_version and os.path.exists(filename):
+        return  # Nothing changed since the last save/load; skip the rewrite.
+    tmp = filename + ".tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(book, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, filename)  # Atomic: a crash mid-write cannot corrupt the old file.
+    book._saved_version = _book_version
 
 
 def load_data(filename="addressbook.pkl"):
     try:
+        # Memory-map the file so pages are faulted in on demand instead of
+        # reading the whole pickle into memory up front.
         with open(filename, "rb") as f:
-            return pickle.load(f)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                book = _MigratingUnpickler(mm).load()
+        if not isinstance(book, AddressBook):
+            # Old-format pickle: _saved_version stays unset so the upgraded
+            # book is rewritten in the current format on exit.
+            return _migrate_book(book)
+        book._saved_version = _book_version
+        return book
     except FileNotFoundError:
         return AddressBook()
+    except (ValueError, EOFError, pickle.UnpicklingError, AttributeError, KeyError):
+        # Empty, truncated or otherwise unreadable file: set it aside rather
+        # than letting the next save clobber whatever data it holds.
+        os.replace(filename, filename + ".bak")
+        return AddressBook()
 
 
-def input_error(func):
-    def inner(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except ValueError:
-            return "Give me corect data please."
-        except IndexError:
-            return "Enter user name please"
-        except KeyError:
-            return "Contact not found"
-        except Exception as e:
-            return f"Помилка: {e}"
+def _catches(exc, message):
+    # Narrow per-handler error decorators: only the errors a handler is
+    # expected to raise become user messages; real bugs propagate.
+    def decorator(func):
+        def inner(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except exc:
+                return message
+        return inner
+    return decorator
 
-    return inner
 
+needs_value = _catches(ValueError, "Give me corect data please.")
+needs_name = _catches(IndexError, "Enter user name please")
 
-@input_error
+
+@needs_value
 def add_contact(args, book: AddressBook):
     name, phone, *_ = args
     record = book.find(name)
@@ -180,12 +355,11 @@ def add_contact(args, book: AddressBook):
         book.add_record(record)
         message = "Contact added."
     if phone:
-        if not phone in [phone.value for phone in record.phones]:
-            record.add_phone(phone)
+        record.add_phone(phone)  # setdefault inside already ignores duplicates.
     return message
 
 
-@input_error
+@needs_value
 def change_contact(args, book):
     name, old_phone, new_phone = args
     record = book.find(name)
@@ -195,17 +369,22 @@ def change_contact(args, book):
     return "Contact not found."
 
 
-@input_error
+@lru_cache(maxsize=1024)
+def _format_phones(name, phones):
+    # Keyed by the phone tuple itself, so a mutated record misses the cache.
+    return f"{name}'s phones: {'; '.join(phones)}" if phones else f"{name} has no phone numbers."
+
+
+@needs_name
 def show_phone(args, book):
     name = args[0]
     record = book.find(name)
     if record:
-        phones = "; ".join(phone.value for phone in record.phones)
-        return f"{name}'s phones: {phones}" if phones else f"{name} has no phone numbers."
+        return _format_phones(name, tuple(record._phones))
     return "Contact not found."
 
 
-@input_error
+@needs_value
 def add_birthday(args, book):
     name, birthday = args
     record = book.find(name)
@@ -215,30 +394,67 @@ def add_birthday(args, book):
     return "Contact not found."
 
 
-@input_error
+@needs_name
 def show_birthday(args, book):
     name = args[0]
     record = book.find(name)
     if record and record.birthday:
-        return record.birthday.value
+        return record.birthday.strftime("%d.%m.%Y")
     return "Birthday not found for this contact."
 
 
-@input_error
+@needs_name
+def load_contacts(args, book):
+    path = args[0]
+    pairs = []
+    try:
+        # Validate the whole file before touching the book, so a bad line
+        # cannot leave it half-updated.
+        with open(path, encoding="utf-8") as f:
+            for lineno, line in enumerate(f, 1):
+                parts = line.split()
+                if not parts:
+                    continue
+                if len(parts) != 2 or _PHONE_RE(parts[1]) is None:
+                    return f"Bad line {lineno} in {path}: {line.strip()!r}"
+                pairs.append(parts)
+    except OSError as e:
+        return f"Cannot read {path}: {e.strerror}"
+    except UnicodeDecodeError:
+        return f"Cannot read {path}: not a UTF-8 text file"
+    count = book.bulk_add(pairs)
+    return f"Loaded {count} contacts from {path}."
+
+
 def birthdays(args, book):
     upcoming = book.get_upcoming_birthdays()
     if upcoming:
-        return "\n".join(f"{b['name']}: {b['birthday']}" for b in upcoming)
+        return "\n".join(upcoming)
     return "No upcoming birthdays."
 
 
-@input_error
 def parse_input(user_input):
-    cmd, *args = user_input.split()
-    cmd = cmd.strip().lower()
+    head, *rest = user_input.split(maxsplit=1) or [""]
+    cmd = head.lower()
+    args = rest[0].split() if rest else []
     return cmd, *args
 
 
+# Command dispatch table: one dict lookup instead of a chain of compares.
+HANDLERS = {
+    "hello": lambda args, book, view: view.display_message("How can I help you?"),
+    "add": lambda args, book, view: view.display_message(add_contact(args, book)),
+    "change": lambda args, book, view: view.display_message(change_contact(args, book)),
+    "phone": lambda args, book, view: view.display_message(show_phone(args, book)),
+    "all": lambda args, book, view: view.display_contacts(book),
+    "add-birthday": lambda args, book, view: view.display_message(add_birthday(args, book)),
+    "show-birthday": lambda args, book, view: view.display_message(show_birthday(args, book)),
+    "birthdays": lambda args, book, view: view.display_message(birthdays(args, book)),
+    "load": lambda args, book, view: view.display_message(load_contacts(args, book)),
+    "help": lambda args, book, view: view.display_help(),
+}
+
+
 def main():
     book = load_data()  # Data loading at startup.
     view = ConsoleView()
@@ -248,38 +464,15 @@ def main():
         user_input = input("Enter a command: ")
         command, *args = parse_input(user_input)
 
-        if command in ["close", "exit"]:
+        if command in ("close", "exit"):
             save_data(book)  # Save data before exiting.
             view.display_message("Good bye!")
             break
 
-        elif command == "hello":
-            view.display_message("How can I help you?")
-
-        elif command == "add":
-            view.display_message(add_contact(args, book))
-
-        elif command == "change":
-            view.display_message(change_contact(args, book))
-
-        elif command == "phone":
-            view.display_message(show_phone(args, book))
-
-        elif command == "all":
-            view.display_contacts(book)
-
-        elif command == "add-birthday":
-            view.display_message(add_birthday(args, book))
-
-        elif command == "show-birthday":
-            view.display_message(show_birthday(args, book))
-
-        elif command == "birthdays":
-            view.display_message(birthdays(args, book))
-
-        elif command == "help":
-            view.display_help()
-
+        book._today = date.today()  # One clock read shared by this command cycle.
+        handler = HANDLERS.get(command)
+        if handler:
+            handler(args, book, view)
         else:
             view.display_message("Invalid command.")
 